@@ -4,11 +4,13 @@ Main file for the backend API.
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 app = FastAPI(
     title="Iterary App API",
     description="Collaborative Group Travel Planning Platform API",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware